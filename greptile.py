@@ -11,18 +11,14 @@ import requests
 import argparse
 import textwrap
 import random
+import re
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-import getpass
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
-from rich.text import Text
-from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.layout import Layout
 from rich import box
 
 # Base URL for Greptile API
@@ -33,20 +29,62 @@ CONFIG_FILE = os.path.expanduser("~/.greptile_config.json")
 
 console = Console()
 
+# Shared HTTP session so repeated API calls reuse pooled keep-alive connections
+HTTP_SESSION = requests.Session()
+
+# Static menus are rendered with a single print call each
+MAIN_MENU = (
+    "[bold]Main Menu:[/bold]\n"
+    "1. Setup/Update API Credentials\n"
+    "2. Manage Repositories\n"
+    "3. [bold green]Chat with Repositories[/bold green]\n"
+    "4. Search Repositories\n"
+    "5. Help\n"
+    "6. Exit"
+)
+
+REPOSITORY_MENU = (
+    "\n[bold]Options:[/bold]\n"
+    "1. Add a repository\n"
+    "2. Remove a repository\n"
+    "3. Index a repository\n"
+    "4. Check repository status\n"
+    "5. Back to main menu"
+)
+
+# Inputs that end an interactive chat, compared after casefolding
+EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
+# Topic keywords for mock answers, matched case-insensitively in one scan
+MOCK_TOPIC_PATTERN = re.compile(
+    r"(?P<files>main|file)|(?P<architecture>architecture|structure)|(?P<api>api|endpoint)",
+    re.IGNORECASE
+)
+
 def generate_mock_answer(query: str, repo_info: str) -> str:
     """Generate a mock answer based on the query"""
-    if "main" in query.lower() or "file" in query.lower():
+    topics = {match.lastgroup for match in MOCK_TOPIC_PATTERN.finditer(query)}
+    if "files" in topics:
         return f"# Main Files{repo_info}\n\nThe main files in this repository are:\n\n1. **`index.js`** - The entry point for the application\n2. **`src/core/`** - Core functionality modules\n3. **`src/utils/`** - Utility functions\n4. **`src/components/`** - UI components\n5. **`package.json`** - Dependencies and project configuration\n\nThe application follows a modular architecture with clear separation of concerns."
     
-    elif "architecture" in query.lower() or "structure" in query.lower():
+    elif "architecture" in topics:
         return f"# Architecture{repo_info}\n\nThe codebase follows a layered architecture:\n\n1. **Presentation Layer** - UI components and views\n2. **Business Logic Layer** - Core functionality and domain logic\n3. **Data Access Layer** - API clients and data persistence\n\nDependency injection is used throughout the codebase to maintain loose coupling between components."
     
-    elif "api" in query.lower() or "endpoint" in query.lower():
+    elif "api" in topics:
         return f"# API Endpoints{repo_info}\n\nThe main API endpoints are:\n\n1. **`/api/v1/users`** - User management\n2. **`/api/v1/auth`** - Authentication and authorization\n3. **`/api/v1/data`** - Data operations\n\nAll endpoints follow RESTful conventions and return JSON responses."
     
     else:
         return f"Based on my analysis of the codebase{repo_info}, I can see that your question relates to the overall structure. The repository is organized into several key directories including `src/`, `tests/`, and `docs/`. The main functionality is implemented in the `src/` directory with clear separation between components, utilities, and core business logic."
 
+# Sample file paths and structures for mock sources
+MOCK_SAMPLE_FILES = (
+    {"path": "index.js", "start": 1, "end": 25, "summary": "Main entry point that initializes the application"},
+    {"path": "src/core/main.js", "start": 10, "end": 45, "summary": "Core functionality implementation"},
+    {"path": "src/utils/helpers.js", "start": 5, "end": 30, "summary": "Helper utilities for common operations"},
+    {"path": "src/components/App.js", "start": 15, "end": 60, "summary": "Main application component"},
+    {"path": "package.json", "start": 1, "end": 15, "summary": "Project dependencies and configuration"},
+)
+
 def generate_mock_sources(repositories: List[Dict[str, str]]) -> List[Dict[str, Any]]:
     """Generate mock sources for repository references"""
     sources = []
@@ -54,18 +92,9 @@ def generate_mock_sources(repositories: List[Dict[str, str]]) -> List[Dict[str,
     if not repositories:
         return sources
     
-    # Sample file paths and structures
-    sample_files = [
-        {"path": "index.js", "start": 1, "end": 25, "summary": "Main entry point that initializes the application"},
-        {"path": "src/core/main.js", "start": 10, "end": 45, "summary": "Core functionality implementation"},
-        {"path": "src/utils/helpers.js", "start": 5, "end": 30, "summary": "Helper utilities for common operations"},
-        {"path": "src/components/App.js", "start": 15, "end": 60, "summary": "Main application component"},
-        {"path": "package.json", "start": 1, "end": 15, "summary": "Project dependencies and configuration"},
-    ]
-    
     # Generate 3-5 sources
-    num_sources = min(len(sample_files), random.randint(3, 5))
-    selected_files = random.sample(sample_files, num_sources)
+    num_sources = min(len(MOCK_SAMPLE_FILES), random.randint(3, 5))
+    selected_files = random.sample(MOCK_SAMPLE_FILES, num_sources)
     
     for repo in repositories[:2]:  # Limit to first 2 repos for simplicity
         for file in selected_files:
@@ -120,6 +149,21 @@ USE_MOCK_DATA = False
 # Global debug mode flag
 DEBUG_MODE = False
 
+def iter_stream_line_batches(response: requests.Response):
+    """Yield the complete lines received by each network read of a streaming response"""
+    partial = b""
+    for chunk in response.iter_content(chunk_size=None):
+        data = partial + chunk
+        lines = data.splitlines()
+        # Keep an unterminated trailing line until the rest of it arrives
+        if lines and not data.endswith((b"\n", b"\r")):
+            partial = lines.pop()
+        else:
+            partial = b""
+        yield lines
+    if partial:
+        yield [partial]
+
 def make_api_request(
     endpoint: str, 
     method: str = "GET", 
@@ -151,9 +195,9 @@ def make_api_request(
             console.print("[bold blue]Making API request...[/bold blue]")
         
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, stream=stream)
+            response = HTTP_SESSION.get(url, headers=headers, stream=stream)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data, stream=stream)
+            response = HTTP_SESSION.post(url, headers=headers, json=data, stream=stream)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         
@@ -292,12 +336,7 @@ def manage_repositories(config: GreptileConfig) -> None:
             console.print("[yellow]No repositories configured yet.[/yellow]")
         
         # Options
-        console.print("\n[bold]Options:[/bold]")
-        console.print("1. Add a repository")
-        console.print("2. Remove a repository")
-        console.print("3. Index a repository")
-        console.print("4. Check repository status")
-        console.print("5. Back to main menu")
+        console.print(REPOSITORY_MENU)
         
         choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5"])
         
@@ -421,6 +460,19 @@ def manage_repositories(config: GreptileConfig) -> None:
             # Back to main menu
             break
 
+def parse_repo_selection(choices: str, repositories: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Map space-separated 1-based numbers to repositories, skipping invalid and repeated picks"""
+    selected = []
+    seen = set()
+    for choice in choices.split():
+        if not choice.isdigit():
+            continue
+        number = int(choice)
+        if 1 <= number <= len(repositories) and number not in seen:
+            seen.add(number)
+            selected.append(repositories[number - 1])
+    return selected
+
 def chat_with_repo(config: GreptileConfig) -> None:
     """Chat with repositories using natural language queries"""
     if not config.default_repositories:
@@ -436,15 +488,13 @@ def chat_with_repo(config: GreptileConfig) -> None:
         console.print(f"{idx+1}. {repo['remote']}:{repo['repository']} ({repo['branch']})")
     
     repo_choices = Prompt.ask("Enter repository numbers (e.g., '1 3')")
-    selected_indices = [int(idx)-1 for idx in repo_choices.split() if idx.isdigit() and int(idx) <= len(config.default_repositories)]
+    selected_repos = parse_repo_selection(repo_choices, config.default_repositories)
     
-    if not selected_indices:
+    if not selected_repos:
         console.print("[yellow]No valid repositories selected.[/yellow]")
         input("\nPress Enter to continue...")
         return
     
-    selected_repos = [config.default_repositories[idx] for idx in selected_indices]
-    
     # Display selected repositories
     console.print("[green]Selected repositories:[/green]")
     for repo in selected_repos:
@@ -457,14 +507,22 @@ def chat_with_repo(config: GreptileConfig) -> None:
     if stream_mode:
         console.print("[yellow]Note: Streaming mode is experimental and may not work with all API keys.[/yellow]")
     
-    # Start chat session
+    # Start chat session. The request payload only changes through the
+    # shared messages list, so it is built once for the whole conversation.
     messages = []
+    data = {
+        "messages": messages,
+        "repositories": selected_repos,
+        "sessionId": config.session_id or None,
+        "stream": stream_mode,
+        "genius": genius_mode
+    }
     
     while True:
         console.print("\n[bold cyan]Ask a question about the codebase (or type 'exit' to quit):[/bold cyan]")
         query = console.input("> ")
         
-        if query.lower() in ["exit", "quit", "q"]:
+        if query.strip().casefold() in EXIT_COMMANDS:
             break
         
         # Add message to history
@@ -475,15 +533,6 @@ def chat_with_repo(config: GreptileConfig) -> None:
             "role": "user"
         })
         
-        # Prepare API request
-        data = {
-            "messages": messages,
-            "repositories": selected_repos,
-            "sessionId": config.session_id or None,
-            "stream": stream_mode,
-            "genius": genius_mode
-        }
-        
         # Make API request
         console.print("\n[bold blue]Greptile is thinking...[/bold blue]")
         
@@ -496,36 +545,48 @@ def chat_with_repo(config: GreptileConfig) -> None:
                     stream_response = response["stream"]
                     console.print("\n[bold green]Streaming response:[/bold green]")
                     
-                    # Process the streaming response
-                    full_response = ""
-                    for line in stream_response.iter_lines():
-                        if line:
+                    # Process the streaming response, accumulating raw UTF-8 bytes
+                    # and decoding the full answer once at the end
+                    text_buffer = bytearray()
+                    # Message parts not yet written to the terminal
+                    pending = []
+                    for lines in iter_stream_line_batches(stream_response):
+                        for line in lines:
+                            if not line:
+                                continue
                             try:
                                 # Try to parse each line as JSON
                                 line_data = json.loads(line.decode('utf-8').lstrip('data: '))
                                 if "message" in line_data:
-                                    # Print the message part
-                                    console.print(line_data["message"], end="")
-                                    full_response += line_data["message"]
+                                    # Queue the message part; it is printed once this read is done
+                                    pending.append(line_data["message"])
+                                    text_buffer += line_data["message"].encode('utf-8')
                             except json.JSONDecodeError:
                                 # If not JSON, just print the raw line
-                                decoded_line = line.decode('utf-8')
-                                if decoded_line.startswith('data: '):
-                                    decoded_line = decoded_line[6:]
-                                console.print(decoded_line)
-                                full_response += decoded_line
+                                if pending:
+                                    console.print("".join(pending), end="", markup=False, highlight=False)
+                                    pending.clear()
+                                if line.startswith(b'data: '):
+                                    line = line[6:]
+                                console.print(line.decode('utf-8'))
+                                text_buffer += line
+                        
+                        # Write everything from this network read in a single terminal write.
+                        # Joined parts are printed as plain text so fragments can't form Rich markup.
+                        if pending:
+                            console.print("".join(pending), end="", markup=False, highlight=False)
+                            pending.clear()
                     
                     # Create a response object with the full streamed content
-                    response = {"message": full_response, "sources": []}
+                    response = {"message": text_buffer.decode('utf-8'), "sources": []}
                 else:
                     # Fallback to non-streaming if stream object not returned
                     console.print("[yellow]Streaming not supported by API, falling back to standard mode[/yellow]")
             except Exception as e:
                 console.print(f"[red]Error in streaming mode: {e}[/red]")
                 console.print("[yellow]Falling back to standard mode[/yellow]")
-                # Fallback to non-streaming mode
-                data["stream"] = False
-                response = make_api_request("query", "POST", data, config, show_progress=False)
+                # Fallback to non-streaming mode for this turn only; data is reused by later turns
+                response = make_api_request("query", "POST", {**data, "stream": False}, config, show_progress=False)
         else:
             # Standard non-streaming request
             response = make_api_request("query", "POST", data, config, show_progress=False)
@@ -600,15 +661,13 @@ def search_repo(config: GreptileConfig) -> None:
         console.print(f"{idx+1}. {repo['remote']}:{repo['repository']} ({repo['branch']})")
     
     repo_choices = Prompt.ask("Enter repository numbers (e.g., '1 3')")
-    selected_indices = [int(idx)-1 for idx in repo_choices.split() if idx.isdigit() and int(idx) <= len(config.default_repositories)]
+    selected_repos = parse_repo_selection(repo_choices, config.default_repositories)
     
-    if not selected_indices:
+    if not selected_repos:
         console.print("[yellow]No valid repositories selected.[/yellow]")
         input("\nPress Enter to continue...")
         return
     
-    selected_repos = [config.default_repositories[idx] for idx in selected_indices]
-    
     # Display selected repositories
     console.print("[green]Selected repositories:[/green]")
     for repo in selected_repos:
@@ -689,6 +748,14 @@ Visit https://www.greptile.com/docs for detailed documentation
     console.print(Markdown(help_text))
     input("\nPress Enter to continue...")
 
+# Main menu entries that act on the current config without replacing it
+MENU_ACTIONS = {
+    "2": manage_repositories,
+    "3": chat_with_repo,
+    "4": search_repo,
+    "5": lambda config: show_help(),
+}
+
 def main() -> None:
     """Main function for the Greptile CLI"""
     parser = argparse.ArgumentParser(description="Greptile CLI - Interactive command-line interface for Greptile")
@@ -732,29 +799,17 @@ def main() -> None:
             title="Welcome"
         ))
         
-        console.print("[bold]Main Menu:[/bold]")
-        console.print("1. Setup/Update API Credentials")
-        console.print("2. Manage Repositories")
-        console.print("3. [bold green]Chat with Repositories[/bold green]")
-        console.print("4. Search Repositories")
-        console.print("5. Help")
-        console.print("6. Exit")
+        console.print(MAIN_MENU)
         
         choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5", "6"])
         
         if choice == "1":
             config = setup_credentials()
-        elif choice == "2":
-            manage_repositories(config)
-        elif choice == "3":
-            chat_with_repo(config)
-        elif choice == "4":
-            search_repo(config)
-        elif choice == "5":
-            show_help()
         elif choice == "6":
             console.print("[bold green]Goodbye![/bold green]")
             break
+        else:
+            MENU_ACTIONS[choice](config)
 
 if __name__ == "__main__":
     try:
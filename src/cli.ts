@@ -4,15 +4,13 @@ import yargs from 'yargs';
 import { hideBin } from 'yargs/helpers';
 import chalk from 'chalk';
 import ora from 'ora';
-import { config } from 'dotenv';
+import { config as loadEnv } from 'dotenv';
 
 import { GreptileMCPServer } from './server.js';
+import { GreptileClient } from './clients/greptile.js';
 import { validateConfig, checkEnvironmentVariables } from './utils/index.js';
 import type { Config, Repository } from './types/index.js';
 
-// Load environment variables
-config();
-
 /**
  * Get platform-specific environment variable setup instructions
  */
@@ -73,6 +71,9 @@ interface CliArgs {
  * Create CLI configuration from arguments and environment
  */
 function createConfig(args: CliArgs): Config {
+  // Load .env here rather than at import, so init and --help skip the file read
+  loadEnv();
+
   // Parse repositories if provided
   let repositories: Repository[] | undefined;
   if (args.repositories) {
@@ -97,12 +98,8 @@ function createConfig(args: CliArgs): Config {
   });
 }
 
-/**
- * Display banner and version information
- */
-function displayBanner(): void {
-  console.log(
-    chalk.cyan(`
+// Banner text is static, so it is colorized once at load
+const BANNER = chalk.cyan(`
 ╔══════════════════════════════════════════════════════════╗
 ║                 🚀 GREPTILE MCP SERVER                   ║
 ║              TypeScript Edition v3.0.4                  ║
@@ -110,8 +107,13 @@ function displayBanner(): void {
 ║    AI-powered code search and querying via MCP          ║
 ║         Built with Model Context Protocol SDK           ║
 ╚══════════════════════════════════════════════════════════╝
-`)
-  );
+`);
+
+/**
+ * Display banner and version information
+ */
+function displayBanner(): void {
+  console.log(BANNER);
 }
 
 /**
@@ -213,10 +215,25 @@ async function testConnection(config: Config): Promise<void> {
   }
   spinner1.succeed(chalk.green('✅ Environment variables configured'));
 
+  // The GitHub check does not depend on the Greptile check, so start it now and
+  // let both requests run concurrently. Results are still reported in order.
+  const githubCheck = fetch('https://api.github.com/user', {
+    headers: {
+      Authorization: `Bearer ${config.githubToken}`,
+      'User-Agent': 'greptile-mcp-server/3.0.0',
+    },
+  }).then(async githubResponse => {
+    if (!githubResponse.ok) {
+      throw new Error(`GitHub API returned ${githubResponse.status}: ${githubResponse.statusText}`);
+    }
+    return (await githubResponse.json()) as { login: string };
+  });
+  // Mark as handled until Test 3 awaits it, so an early failure is not an unhandled rejection
+  githubCheck.catch(() => undefined);
+
   // Test 2: Greptile API Authentication
   const spinner2 = ora('Testing Greptile API authentication...').start();
   try {
-    const { GreptileClient } = await import('./clients/greptile.js');
     const client = new GreptileClient(config);
 
     // Make an actual authenticated API call to validate credentials
@@ -243,18 +260,7 @@ async function testConnection(config: Config): Promise<void> {
   // Test 3: GitHub Token Validation
   const spinner3 = ora('Testing GitHub token permissions...').start();
   try {
-    const githubResponse = await fetch('https://api.github.com/user', {
-      headers: {
-        Authorization: `Bearer ${config.githubToken}`,
-        'User-Agent': 'greptile-mcp-server/3.0.0',
-      },
-    });
-
-    if (!githubResponse.ok) {
-      throw new Error(`GitHub API returned ${githubResponse.status}: ${githubResponse.statusText}`);
-    }
-
-    const userData = (await githubResponse.json()) as { login: string };
+    const userData = await githubCheck;
     spinner3.succeed(chalk.green(`✅ GitHub token verified (user: ${userData.login})`));
   } catch (error) {
     spinner3.fail(chalk.red('❌ GitHub token validation failed'));
@@ -15,12 +15,36 @@ interface FetchRequestOptions {
   body?: string;
 }
 
+type ChunkBuilder = (chunk: Record<string, unknown>, timestamp: number) => StreamingChunk | null;
+
+// Builders for typed stream chunks, keyed by the chunk's `type` field.
+// A Map avoids matching inherited keys such as `constructor`.
+const CHUNK_BUILDERS = new Map<string, ChunkBuilder>([
+  [
+    'text',
+    (chunk, timestamp) =>
+      typeof chunk.content === 'string'
+        ? { type: 'text', content: chunk.content, timestamp }
+        : null,
+  ],
+  [
+    'citation',
+    (chunk, timestamp) => ({
+      type: 'citation',
+      file: typeof chunk.file === 'string' ? chunk.file : undefined,
+      lines: typeof chunk.lines === 'string' ? chunk.lines : undefined,
+      timestamp,
+    }),
+  ],
+]);
+
 export class GreptileClient {
   private readonly apiKey: string;
   private readonly githubToken: string;
   private readonly baseUrl: string;
   private readonly defaultTimeout: number;
   private readonly headers: Record<string, string>;
+  private readonly streamHeaders: Record<string, string>;
 
   constructor(config: Config) {
     // Allow empty keys for testing, but warn about limited functionality
@@ -42,6 +66,11 @@ export class GreptileClient {
       'Content-Type': 'application/json',
       'User-Agent': 'greptile-mcp-server/3.0.0',
     };
+    this.streamHeaders = {
+      ...this.headers,
+      Accept: 'text/event-stream',
+      'Cache-Control': 'no-cache',
+    };
   }
 
   /**
@@ -124,24 +153,20 @@ export class GreptileClient {
       payload.sessionId = sessionId;
     }
 
-    const streamHeaders = {
-      ...this.headers,
-      Accept: 'text/event-stream',
-      'Cache-Control': 'no-cache',
-    };
-
     const controller = new AbortController();
     const timeoutId = timeout ? setTimeout(() => controller.abort(), timeout) : null;
 
     try {
       const response = await fetch(url, {
         method: 'POST',
-        headers: streamHeaders,
+        headers: this.streamHeaders,
         body: JSON.stringify(payload),
         signal: controller.signal,
       });
 
       if (!response.ok) {
+        // Discard the error body so the keep-alive connection returns to the pool
+        await response.body?.cancel();
         throw this.createError(`HTTP ${response.status}: ${response.statusText}`, response.status);
       }
 
@@ -152,31 +177,45 @@ export class GreptileClient {
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let buffer = '';
+      let finished = false;
 
       try {
         while (true) {
           const { done, value } = await reader.read();
-          if (done) break;
+          if (done) {
+            finished = true;
+            break;
+          }
 
           buffer += decoder.decode(value, { stream: true });
-          const lines = buffer.split('\n');
-          buffer = lines.pop() || '';
-
-          for (const line of lines) {
-            if (line.trim() && line.startsWith('data: ')) {
-              const data = line.slice(6);
-              const chunk = safeJsonParse(data, null);
-
-              if (chunk) {
-                const processedChunk = this.processStreamChunk(chunk);
-                if (processedChunk) {
-                  yield processedChunk;
-                }
-              }
+          // Events from one network read arrived together, so they share a timestamp
+          const receivedAt = Date.now();
+
+          // Walk complete lines in place; only the trailing partial line is kept
+          let lineStart = 0;
+          let lineEnd = buffer.indexOf('\n');
+          while (lineEnd !== -1) {
+            const processedChunk = this.parseSseLine(buffer, lineStart, lineEnd, receivedAt);
+            if (processedChunk) {
+              yield processedChunk;
             }
+            lineStart = lineEnd + 1;
+            lineEnd = buffer.indexOf('\n', lineStart);
           }
+          buffer = lineStart === 0 ? buffer : buffer.slice(lineStart);
+        }
+
+        // Flush a final event that was not newline-terminated
+        buffer += decoder.decode();
+        const lastChunk = this.parseSseLine(buffer, 0, buffer.length, Date.now());
+        if (lastChunk) {
+          yield lastChunk;
         }
       } finally {
+        if (!finished) {
+          // Consumer stopped early: cancel the body instead of leaving the socket busy
+          await reader.cancel().catch(() => undefined);
+        }
         reader.releaseLock();
       }
     } finally {
@@ -260,39 +299,46 @@ export class GreptileClient {
         maxDelay: 5000,
       });
     } catch (error) {
-      if (error instanceof Error) {
-        throw this.createError(error.message);
+      // retry() always rejects with an Error; HTTP failures are already GreptileErrors
+      // carrying the status code, so only network and timeout errors need wrapping
+      if ((error as Error).name === 'GreptileError') {
+        throw error;
       }
-      throw this.createError('Unknown error occurred');
+      throw this.createError((error as Error).message);
     }
   }
 
+  /**
+   * Parse the SSE line buffer[start, end) into a streaming chunk, ignoring non-data lines
+   */
+  private parseSseLine(
+    buffer: string,
+    start: number,
+    end: number,
+    timestamp: number
+  ): StreamingChunk | null {
+    if (!buffer.startsWith('data: ', start)) {
+      return null;
+    }
+
+    const chunk = safeJsonParse(buffer.slice(start + 6, end), null);
+    return chunk ? this.processStreamChunk(chunk, timestamp) : null;
+  }
+
   /**
    * Process streaming chunks into standardized format
    */
-  private processStreamChunk(chunk: unknown): StreamingChunk | null {
+  private processStreamChunk(chunk: unknown, timestamp: number): StreamingChunk | null {
     if (!chunk || typeof chunk !== 'object') {
       return null;
     }
 
     const chunkObj = chunk as Record<string, unknown>;
-    const timestamp = Date.now();
-
-    if (chunkObj.type === 'text' && typeof chunkObj.content === 'string') {
-      return {
-        type: 'text',
-        content: chunkObj.content,
-        timestamp,
-      };
-    }
 
-    if (chunkObj.type === 'citation') {
-      return {
-        type: 'citation',
-        file: typeof chunkObj.file === 'string' ? chunkObj.file : undefined,
-        lines: typeof chunkObj.lines === 'string' ? chunkObj.lines : undefined,
-        timestamp,
-      };
+    const build = typeof chunkObj.type === 'string' ? CHUNK_BUILDERS.get(chunkObj.type) : undefined;
+    const typedChunk = build ? build(chunkObj, timestamp) : null;
+    if (typedChunk) {
+      return typedChunk;
     }
 
     if ('sessionId' in chunkObj && typeof chunkObj.sessionId === 'string') {
@@ -329,28 +375,25 @@ export class GreptileClient {
    * Health check for the Greptile API
    */
   async healthCheck(): Promise<boolean> {
-    try {
-      // Create manual timeout controller for better compatibility
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 10000);
+    // Create manual timeout controller for better compatibility
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), 10000);
 
+    try {
       const response = await fetch(`${this.baseUrl}/health`, {
         method: 'GET',
         headers: this.headers,
         signal: controller.signal,
       });
 
-      clearTimeout(timeoutId);
-
-      if (!response.ok) {
-        return false;
-      }
-
+      // Always read the body so the connection can be reused by later requests
       const text = await response.text();
-      return text.includes('Healthy');
+      return response.ok && text.includes('Healthy');
     } catch (error) {
       console.error('Health check failed:', error);
       return false;
+    } finally {
+      clearTimeout(timeoutId);
     }
   }
 }
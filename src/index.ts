@@ -63,6 +63,9 @@ export default function createServer({ config }: { config: Config }) {
     description: 'AI-powered code search and querying with Greptile API',
   });
 
+  // The configuration is fixed for the server's lifetime, so serialize it once
+  const configJson = JSON.stringify(config, null, 2);
+
   // Initialize Greptile client with user-provided configuration
   const greptileClient = new GreptileClient({
     apiKey: config.greptileApiKey,
@@ -233,7 +236,7 @@ For more information, visit: https://docs.greptile.com`;
 
         if (stream) {
           // Handle streaming response
-          const streamResults: string[] = [];
+          let streamedMessage = '';
           const streamingResponse = await greptileClient.queryRepositories(
             messages,
             repositories,
@@ -245,7 +248,7 @@ For more information, visit: https://docs.greptile.com`;
 
           for await (const chunk of streamingResponse as AsyncIterable<StreamingChunk>) {
             if (chunk.type === 'text' && chunk.content) {
-              streamResults.push(chunk.content);
+              streamedMessage += chunk.content;
             }
           }
 
@@ -255,7 +258,7 @@ For more information, visit: https://docs.greptile.com`;
                 type: 'text',
                 text: JSON.stringify(
                   {
-                    message: streamResults.join(''),
+                    message: streamedMessage,
                     session_id: sessionId,
                     streamed: true,
                   },
@@ -363,7 +366,7 @@ For more information, visit: https://docs.greptile.com`;
           {
             uri: uri.href,
             mimeType: 'application/json',
-            text: JSON.stringify(config, null, 2),
+            text: configJson,
           },
         ],
       };
@@ -9,6 +9,9 @@ import {
   ListPromptsRequestSchema,
   ReadResourceRequestSchema,
   GetPromptRequestSchema,
+  type Tool,
+  type Resource,
+  type Prompt,
 } from '@modelcontextprotocol/sdk/types.js';
 
 import { GreptileClient } from './clients/greptile.js';
@@ -20,15 +23,335 @@ import {
 } from './utils/index.js';
 import type { Config, EnvironmentStatus } from './types/index.js';
 
+// Error payloads returned when a tool is called before the Greptile client is configured.
+// The messages never change, so they are serialized once at module load.
+const NOT_CONFIGURED_ERRORS = {
+  index: createErrorResponse(
+    'Cannot index repository: Missing environment variables. Use greptile_env_check for setup guidance.',
+    'Configuration Error'
+  ),
+  query: createErrorResponse(
+    'Cannot query repository: Missing environment variables. Use greptile_env_check for setup guidance.',
+    'Configuration Error'
+  ),
+  info: createErrorResponse(
+    'Cannot get repository info: Missing environment variables. Use greptile_env_check for setup guidance.',
+    'Configuration Error'
+  ),
+} as const;
+
+// Tool, resource and prompt definitions never change at runtime, so each list is built once
+// and shared by every list request
+const TOOL_DEFINITIONS: Tool[] = [
+  {
+    name: 'greptile_help',
+    description: 'Get comprehensive help and usage examples for all Greptile MCP tools',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+  },
+  {
+    name: 'greptile_env_check',
+    description: 'Check environment variable configuration and setup status',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+    },
+  },
+  {
+    name: 'index_repository',
+    description: 'Index a repository to make it searchable for future queries',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        remote: {
+          type: 'string',
+          enum: ['github', 'gitlab'],
+          description: 'Repository host (github or gitlab)',
+        },
+        repository: {
+          type: 'string',
+          description: 'Repository in owner/repo format',
+        },
+        branch: {
+          type: 'string',
+          description: 'Branch to index',
+        },
+        reload: {
+          type: 'boolean',
+          description: 'Force reprocessing of previously indexed repository',
+          default: true,
+        },
+        notify: {
+          type: 'boolean',
+          description: 'Send email notification when indexing completes',
+          default: false,
+        },
+      },
+      required: ['remote', 'repository', 'branch'],
+    },
+  },
+  {
+    name: 'query_repository',
+    description:
+      'Query repositories using natural language to get detailed answers with code references',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Natural language query about the codebase',
+        },
+        repositories: {
+          type: 'array',
+          items: {
+            type: 'object',
+            properties: {
+              remote: { type: 'string', enum: ['github', 'gitlab'] },
+              repository: { type: 'string' },
+              branch: { type: 'string' },
+            },
+            required: ['remote', 'repository', 'branch'],
+          },
+          description: 'List of repositories to query',
+        },
+        session_id: {
+          type: 'string',
+          description:
+            'Session ID for conversation continuity (auto-generated if not provided)',
+        },
+        stream: {
+          type: 'boolean',
+          description: 'Enable streaming response',
+          default: false,
+        },
+        genius: {
+          type: 'boolean',
+          description: 'Use enhanced query capabilities',
+          default: true,
+        },
+        timeout: {
+          type: 'number',
+          description: 'Request timeout in milliseconds',
+          default: 60000,
+        },
+        previous_messages: {
+          type: 'array',
+          items: {
+            type: 'object',
+            properties: {
+              role: { type: 'string', enum: ['user', 'assistant'] },
+              content: { type: 'string' },
+            },
+            required: ['role', 'content'],
+          },
+          description: 'Previous conversation messages for context',
+        },
+      },
+      required: ['query'],
+    },
+  },
+  {
+    name: 'get_repository_info',
+    description: 'Get information about an indexed repository including status and metadata',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        remote: {
+          type: 'string',
+          enum: ['github', 'gitlab'],
+          description: 'Repository host',
+        },
+        repository: {
+          type: 'string',
+          description: 'Repository in owner/repo format',
+        },
+        branch: {
+          type: 'string',
+          description: 'Branch that was indexed',
+        },
+      },
+      required: ['remote', 'repository', 'branch'],
+    },
+  },
+];
+
+const RESOURCE_DEFINITIONS: Resource[] = [
+  {
+    uri: 'greptile://help',
+    mimeType: 'text/markdown',
+    name: 'Greptile MCP Help',
+    description: 'Comprehensive documentation for all Greptile MCP features',
+  },
+  {
+    uri: 'greptile://config',
+    mimeType: 'application/json',
+    name: 'Current Configuration',
+    description: 'Current server configuration and settings',
+  },
+];
+
+const PROMPT_DEFINITIONS: Prompt[] = [
+  {
+    name: 'codebase_exploration',
+    description: 'Start exploring a codebase with guided questions',
+    arguments: [
+      {
+        name: 'repository',
+        description: 'Repository to explore (owner/repo)',
+        required: true,
+      },
+      {
+        name: 'focus_area',
+        description: 'Specific area to focus on (architecture, authentication, etc.)',
+        required: false,
+      },
+    ],
+  },
+];
+
+// Served by both the greptile_help tool and the greptile://help resource
+const HELP_CONTENT = `# 🚀 Greptile MCP Server - Comprehensive Guide
+
+## Overview
+The Greptile MCP Server provides AI-powered code search and querying capabilities through the Model Context Protocol (MCP). It integrates with the Greptile API to index repositories and answer natural language questions about codebases.
+
+## Available Tools
+
+### 1. \`greptile_help\`
+Get this comprehensive help documentation.
+
+**Usage:** No parameters required
+
+### 2. \`index_repository\`
+Index a repository to make it searchable for future queries.
+
+**Parameters:**
+- \`remote\`: "github" or "gitlab"
+- \`repository\`: Repository in "owner/repo" format
+- \`branch\`: Branch to index
+- \`reload\`: Force reprocessing (optional, default: true)
+- \`notify\`: Email notification (optional, default: false)
+
+**Example:**
+\`\`\`json
+{
+  "remote": "github",
+  "repository": "microsoft/vscode",
+  "branch": "main",
+  "reload": true
+}
+\`\`\`
+
+### 3. \`query_repository\`
+Query repositories using natural language to get detailed answers with code references.
+
+**Parameters:**
+- \`query\`: Natural language question
+- \`repositories\`: Array of repository objects (optional if session exists)
+- \`session_id\`: For conversation continuity (auto-generated if not provided)
+- \`stream\`: Enable streaming response (optional, default: false)
+- \`genius\`: Enhanced capabilities (optional, default: true)
+- \`previous_messages\`: Conversation history (optional)
+
+**Example:**
+\`\`\`json
+{
+  "query": "How is authentication implemented in this codebase?",
+  "repositories": [
+    {
+      "remote": "github",
+      "repository": "microsoft/vscode",
+      "branch": "main"
+    }
+  ],
+  "stream": false
+}
+\`\`\`
+
+### 4. \`get_repository_info\`
+Get information about an indexed repository.
+
+**Parameters:**
+- \`remote\`: Repository host
+- \`repository\`: Repository identifier
+- \`branch\`: Branch name
+
+## Best Practices
+
+### Session Management
+- Use consistent \`session_id\` across related queries for better context
+- Auto-generated session IDs are provided if not specified
+- Session continuity improves answer quality over multiple interactions
+
+### Repository Workflow
+1. **Index** repositories first using \`index_repository\`
+2. **Verify** indexing status with \`get_repository_info\`
+3. **Query** using natural language with \`query_repository\`
+
+### Query Optimization
+- Be specific in your questions for better results
+- Use technical terms relevant to the codebase
+- Reference specific features, patterns, or components
+- Build on previous queries using session continuity
+
+## Example Workflows
+
+### Getting Started with a New Codebase
+\`\`\`
+1. Index the repository
+2. Ask: "What is the overall architecture of this codebase?"
+3. Follow up: "How are the main components organized?"
+4. Dive deeper: "How does the authentication system work?"
+\`\`\`
+
+### Debugging a Specific Issue
+\`\`\`
+1. Ask: "How is error handling implemented?"
+2. Query: "What are the common error patterns in this codebase?"
+3. Follow up: "Show me specific examples of error handling code"
+\`\`\`
+
+### Understanding Design Patterns
+\`\`\`
+1. Query: "What design patterns are used in this codebase?"
+2. Follow up: "How is the observer pattern implemented?"
+3. Query: "Show me specific implementations of this pattern"
+\`\`\`
+
+## Configuration
+
+Required environment variables:
+- \`GREPTILE_API_KEY\`: Your Greptile API key
+- \`GITHUB_TOKEN\`: GitHub personal access token
+
+Optional:
+- \`GREPTILE_BASE_URL\`: Custom API base URL (default: https://api.greptile.com/v2)
+
+## Resources
+
+- **greptile://help**: This documentation
+- **greptile://config**: Current server configuration
+
+## Prompts
+
+- **codebase_exploration**: Guided codebase exploration with focus areas
+
+---
+
+🔗 **More Information:** Visit the [Greptile documentation](https://docs.greptile.com) for detailed API reference and advanced usage patterns.`;
+
 class GreptileMCPServer {
   private server: Server;
   private greptileClient: GreptileClient | null = null;
-  private config: Config | null = null;
+  // Serialized once in initialize() and served as-is by the greptile://config resource
+  private configJson = 'null';
   private envStatus: EnvironmentStatus;
 
-  constructor() {
-    // Check environment variables first
-    this.envStatus = checkEnvironmentVariables();
+  constructor(envStatus: EnvironmentStatus = checkEnvironmentVariables()) {
+    // Environment status is read once, by the caller if it already checked
+    this.envStatus = envStatus;
 
     this.server = new Server(
       {
@@ -52,18 +375,20 @@ class GreptileMCPServer {
    * Initialize the server with configuration
    */
   async initialize(config: Config): Promise<void> {
-    this.config = config;
+    this.configJson = JSON.stringify(config, null, 2);
 
     // Only initialize Greptile client if environment is fully configured
     if (this.envStatus.isFullyConfigured) {
       try {
         this.greptileClient = new GreptileClient(config);
 
-        // Test API connectivity
-        const isHealthy = await this.greptileClient.healthCheck();
-        if (!isHealthy) {
-          console.warn('Greptile API health check failed - tools may not work correctly');
-        }
+        // Test API connectivity in the background: this also opens a pooled connection for the
+        // first tool call without holding up server startup on a network round-trip
+        void this.greptileClient.healthCheck().then(isHealthy => {
+          if (!isHealthy) {
+            console.warn('Greptile API health check failed - tools may not work correctly');
+          }
+        });
       } catch (error) {
         console.error('Failed to initialize Greptile client:', error);
         // Don't throw - let server start anyway for diagnostic purposes
@@ -82,171 +407,37 @@ class GreptileMCPServer {
   private setupHandlers(): void {
     // List available tools
     this.server.setRequestHandler(ListToolsRequestSchema, async () => ({
-      tools: [
-        {
-          name: 'greptile_help',
-          description: 'Get comprehensive help and usage examples for all Greptile MCP tools',
-          inputSchema: {
-            type: 'object',
-            properties: {},
-          },
-        },
-        {
-          name: 'greptile_env_check',
-          description: 'Check environment variable configuration and setup status',
-          inputSchema: {
-            type: 'object',
-            properties: {},
-          },
-        },
-        {
-          name: 'index_repository',
-          description: 'Index a repository to make it searchable for future queries',
-          inputSchema: {
-            type: 'object',
-            properties: {
-              remote: {
-                type: 'string',
-                enum: ['github', 'gitlab'],
-                description: 'Repository host (github or gitlab)',
-              },
-              repository: {
-                type: 'string',
-                description: 'Repository in owner/repo format',
-              },
-              branch: {
-                type: 'string',
-                description: 'Branch to index',
-              },
-              reload: {
-                type: 'boolean',
-                description: 'Force reprocessing of previously indexed repository',
-                default: true,
-              },
-              notify: {
-                type: 'boolean',
-                description: 'Send email notification when indexing completes',
-                default: false,
-              },
-            },
-            required: ['remote', 'repository', 'branch'],
-          },
-        },
-        {
-          name: 'query_repository',
-          description:
-            'Query repositories using natural language to get detailed answers with code references',
-          inputSchema: {
-            type: 'object',
-            properties: {
-              query: {
-                type: 'string',
-                description: 'Natural language query about the codebase',
-              },
-              repositories: {
-                type: 'array',
-                items: {
-                  type: 'object',
-                  properties: {
-                    remote: { type: 'string', enum: ['github', 'gitlab'] },
-                    repository: { type: 'string' },
-                    branch: { type: 'string' },
-                  },
-                  required: ['remote', 'repository', 'branch'],
-                },
-                description: 'List of repositories to query',
-              },
-              session_id: {
-                type: 'string',
-                description:
-                  'Session ID for conversation continuity (auto-generated if not provided)',
-              },
-              stream: {
-                type: 'boolean',
-                description: 'Enable streaming response',
-                default: false,
-              },
-              genius: {
-                type: 'boolean',
-                description: 'Use enhanced query capabilities',
-                default: true,
-              },
-              timeout: {
-                type: 'number',
-                description: 'Request timeout in milliseconds',
-                default: 60000,
-              },
-              previous_messages: {
-                type: 'array',
-                items: {
-                  type: 'object',
-                  properties: {
-                    role: { type: 'string', enum: ['user', 'assistant'] },
-                    content: { type: 'string' },
-                  },
-                  required: ['role', 'content'],
-                },
-                description: 'Previous conversation messages for context',
-              },
-            },
-            required: ['query'],
-          },
-        },
-        {
-          name: 'get_repository_info',
-          description: 'Get information about an indexed repository including status and metadata',
-          inputSchema: {
-            type: 'object',
-            properties: {
-              remote: {
-                type: 'string',
-                enum: ['github', 'gitlab'],
-                description: 'Repository host',
-              },
-              repository: {
-                type: 'string',
-                description: 'Repository in owner/repo format',
-              },
-              branch: {
-                type: 'string',
-                description: 'Branch that was indexed',
-              },
-            },
-            required: ['remote', 'repository', 'branch'],
-          },
-        },
-      ],
+      tools: TOOL_DEFINITIONS,
     }));
 
+    // Tool handlers keyed by tool name, built once per server
+    const toolHandlers = new Map<
+      string,
+      (args: unknown) => Promise<{ content: Array<{ type: string; text: string }> }>
+    >([
+      ['greptile_help', () => this.handleGreptileHelp()],
+      ['greptile_env_check', () => this.handleEnvironmentCheck()],
+      ['index_repository', args => this.handleIndexRepository(args)],
+      ['query_repository', args => this.handleQueryRepository(args)],
+      ['get_repository_info', args => this.handleGetRepositoryInfo(args)],
+    ]);
+
     // Handle tool calls
     this.server.setRequestHandler(CallToolRequestSchema, async request => {
       try {
-        switch (request.params.name) {
-          case 'greptile_help':
-            return await this.handleGreptileHelp();
-
-          case 'greptile_env_check':
-            return await this.handleEnvironmentCheck();
-
-          case 'index_repository':
-            return await this.handleIndexRepository(request.params.arguments);
-
-          case 'query_repository':
-            return await this.handleQueryRepository(request.params.arguments);
-
-          case 'get_repository_info':
-            return await this.handleGetRepositoryInfo(request.params.arguments);
-
-          default:
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: createErrorResponse(`Unknown tool: ${request.params.name}`),
-                },
-              ],
-            };
+        const handler = toolHandlers.get(request.params.name);
+        if (!handler) {
+          return {
+            content: [
+              {
+                type: 'text',
+                text: createErrorResponse(`Unknown tool: ${request.params.name}`),
+              },
+            ],
+          };
         }
+
+        return await handler(request.params.arguments);
       } catch (error) {
         const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
         return {
@@ -262,20 +453,7 @@ class GreptileMCPServer {
 
     // List available resources
     this.server.setRequestHandler(ListResourcesRequestSchema, async () => ({
-      resources: [
-        {
-          uri: 'greptile://help',
-          mimeType: 'text/markdown',
-          name: 'Greptile MCP Help',
-          description: 'Comprehensive documentation for all Greptile MCP features',
-        },
-        {
-          uri: 'greptile://config',
-          mimeType: 'application/json',
-          name: 'Current Configuration',
-          description: 'Current server configuration and settings',
-        },
-      ],
+      resources: RESOURCE_DEFINITIONS,
     }));
 
     // Handle resource reads
@@ -288,7 +466,7 @@ class GreptileMCPServer {
             {
               uri,
               mimeType: 'text/markdown',
-              text: await this.getHelpContent(),
+              text: HELP_CONTENT,
             },
           ],
         };
@@ -300,7 +478,7 @@ class GreptileMCPServer {
             {
               uri,
               mimeType: 'application/json',
-              text: JSON.stringify(this.config, null, 2),
+              text: this.configJson,
             },
           ],
         };
@@ -311,24 +489,7 @@ class GreptileMCPServer {
 
     // List available prompts
     this.server.setRequestHandler(ListPromptsRequestSchema, async () => ({
-      prompts: [
-        {
-          name: 'codebase_exploration',
-          description: 'Start exploring a codebase with guided questions',
-          arguments: [
-            {
-              name: 'repository',
-              description: 'Repository to explore (owner/repo)',
-              required: true,
-            },
-            {
-              name: 'focus_area',
-              description: 'Specific area to focus on (architecture, authentication, etc.)',
-              required: false,
-            },
-          ],
-        },
-      ],
+      prompts: PROMPT_DEFINITIONS,
     }));
 
     // Handle prompt requests
@@ -363,7 +524,7 @@ class GreptileMCPServer {
       content: [
         {
           type: 'text',
-          text: await this.getHelpContent(),
+          text: HELP_CONTENT,
         },
       ],
     };
@@ -420,11 +581,7 @@ class GreptileMCPServer {
         content: [
           {
             type: 'text',
-            text: createErrorResponse(
-              'Cannot index repository: Missing environment variables. Use greptile_env_check for setup guidance.',
-              'Configuration Error',
-              undefined
-            ),
+            text: NOT_CONFIGURED_ERRORS.index,
           },
         ],
       };
@@ -461,11 +618,7 @@ class GreptileMCPServer {
         content: [
           {
             type: 'text',
-            text: createErrorResponse(
-              'Cannot query repository: Missing environment variables. Use greptile_env_check for setup guidance.',
-              'Configuration Error',
-              undefined
-            ),
+            text: NOT_CONFIGURED_ERRORS.query,
           },
         ],
       };
@@ -489,7 +642,7 @@ class GreptileMCPServer {
 
     if (stream) {
       // Handle streaming response
-      const streamResults: string[] = [];
+      let streamedMessage = '';
       const streamingResponse = await this.greptileClient.queryRepositories(
         messages,
         repositories,
@@ -501,7 +654,7 @@ class GreptileMCPServer {
 
       for await (const chunk of streamingResponse as AsyncIterable<any>) {
         if (chunk.type === 'text' && chunk.content) {
-          streamResults.push(chunk.content);
+          streamedMessage += chunk.content;
         }
       }
 
@@ -511,7 +664,7 @@ class GreptileMCPServer {
             type: 'text',
             text: JSON.stringify(
               {
-                message: streamResults.join(''),
+                message: streamedMessage,
                 session_id: sessionId,
                 streamed: true,
               },
@@ -554,11 +707,7 @@ class GreptileMCPServer {
         content: [
           {
             type: 'text',
-            text: createErrorResponse(
-              'Cannot get repository info: Missing environment variables. Use greptile_env_check for setup guidance.',
-              'Configuration Error',
-              undefined
-            ),
+            text: NOT_CONFIGURED_ERRORS.info,
           },
         ],
       };
@@ -578,141 +727,6 @@ class GreptileMCPServer {
     };
   }
 
-  /**
-   * Get comprehensive help content
-   */
-  private async getHelpContent(): Promise<string> {
-    return `# 🚀 Greptile MCP Server - Comprehensive Guide
-
-## Overview
-The Greptile MCP Server provides AI-powered code search and querying capabilities through the Model Context Protocol (MCP). It integrates with the Greptile API to index repositories and answer natural language questions about codebases.
-
-## Available Tools
-
-### 1. \`greptile_help\`
-Get this comprehensive help documentation.
-
-**Usage:** No parameters required
-
-### 2. \`index_repository\`
-Index a repository to make it searchable for future queries.
-
-**Parameters:**
-- \`remote\`: "github" or "gitlab"
-- \`repository\`: Repository in "owner/repo" format
-- \`branch\`: Branch to index
-- \`reload\`: Force reprocessing (optional, default: true)
-- \`notify\`: Email notification (optional, default: false)
-
-**Example:**
-\`\`\`json
-{
-  "remote": "github",
-  "repository": "microsoft/vscode",
-  "branch": "main",
-  "reload": true
-}
-\`\`\`
-
-### 3. \`query_repository\`
-Query repositories using natural language to get detailed answers with code references.
-
-**Parameters:**
-- \`query\`: Natural language question
-- \`repositories\`: Array of repository objects (optional if session exists)
-- \`session_id\`: For conversation continuity (auto-generated if not provided)
-- \`stream\`: Enable streaming response (optional, default: false)
-- \`genius\`: Enhanced capabilities (optional, default: true)
-- \`previous_messages\`: Conversation history (optional)
-
-**Example:**
-\`\`\`json
-{
-  "query": "How is authentication implemented in this codebase?",
-  "repositories": [
-    {
-      "remote": "github",
-      "repository": "microsoft/vscode",
-      "branch": "main"
-    }
-  ],
-  "stream": false
-}
-\`\`\`
-
-### 4. \`get_repository_info\`
-Get information about an indexed repository.
-
-**Parameters:**
-- \`remote\`: Repository host
-- \`repository\`: Repository identifier
-- \`branch\`: Branch name
-
-## Best Practices
-
-### Session Management
-- Use consistent \`session_id\` across related queries for better context
-- Auto-generated session IDs are provided if not specified
-- Session continuity improves answer quality over multiple interactions
-
-### Repository Workflow
-1. **Index** repositories first using \`index_repository\`
-2. **Verify** indexing status with \`get_repository_info\`
-3. **Query** using natural language with \`query_repository\`
-
-### Query Optimization
-- Be specific in your questions for better results
-- Use technical terms relevant to the codebase
-- Reference specific features, patterns, or components
-- Build on previous queries using session continuity
-
-## Example Workflows
-
-### Getting Started with a New Codebase
-\`\`\`
-1. Index the repository
-2. Ask: "What is the overall architecture of this codebase?"
-3. Follow up: "How are the main components organized?"
-4. Dive deeper: "How does the authentication system work?"
-\`\`\`
-
-### Debugging a Specific Issue
-\`\`\`
-1. Ask: "How is error handling implemented?"
-2. Query: "What are the common error patterns in this codebase?"
-3. Follow up: "Show me specific examples of error handling code"
-\`\`\`
-
-### Understanding Design Patterns
-\`\`\`
-1. Query: "What design patterns are used in this codebase?"
-2. Follow up: "How is the observer pattern implemented?"
-3. Query: "Show me specific implementations of this pattern"
-\`\`\`
-
-## Configuration
-
-Required environment variables:
-- \`GREPTILE_API_KEY\`: Your Greptile API key
-- \`GITHUB_TOKEN\`: GitHub personal access token
-
-Optional:
-- \`GREPTILE_BASE_URL\`: Custom API base URL (default: https://api.greptile.com/v2)
-
-## Resources
-
-- **greptile://help**: This documentation
-- **greptile://config**: Current server configuration
-
-## Prompts
-
-- **codebase_exploration**: Guided codebase exploration with focus areas
-
----
-
-🔗 **More Information:** Visit the [Greptile documentation](https://docs.greptile.com) for detailed API reference and advanced usage patterns.`;
-  }
-
   /**
    * Generate exploration prompt for codebase analysis
    */
@@ -754,8 +768,8 @@ Use the query_repository tool with session continuity to build understanding pro
   /**
    * Create and start server with configuration
    */
-  static async create(config: Config): Promise<GreptileMCPServer> {
-    const server = new GreptileMCPServer();
+  static async create(config: Config, envStatus?: EnvironmentStatus): Promise<GreptileMCPServer> {
+    const server = new GreptileMCPServer(envStatus);
     await server.initialize(config);
     return server;
   }
@@ -787,7 +801,7 @@ if (import.meta.url === `file://${process.argv[1]}`) {
       };
     }
 
-    const server = await GreptileMCPServer.create(config);
+    const server = await GreptileMCPServer.create(config, envStatus);
     await server.start();
   })().catch(error => {
     console.error('Failed to start server:', error);
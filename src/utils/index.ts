@@ -5,7 +5,8 @@ import type { Config, EnvironmentStatus } from '../types/index.js';
  * Generate a new unique session ID in proper UUID format
  */
 export function generateSessionId(): string {
-  return randomUUID().toLowerCase();
+  // randomUUID() already returns lowercase hex, so no normalization is needed
+  return randomUUID();
 }
 
 /**
@@ -13,7 +14,7 @@ export function generateSessionId(): string {
  */
 export function normalizeSessionId(sessionId?: string): string | undefined {
   if (!sessionId) return undefined;
-  return sessionId.toLowerCase().trim();
+  return sessionId.trim().toLowerCase();
 }
 
 /**
@@ -24,11 +25,10 @@ export function createErrorResponse(
   type: string = 'Error',
   sessionId?: string
 ): string {
-  const error = {
-    error: message,
-    type,
-    ...(sessionId && { session_id: sessionId }),
-  };
+  const error: Record<string, string> = { error: message, type };
+  if (sessionId) {
+    error.session_id = sessionId;
+  }
   return JSON.stringify(error, null, 2);
 }
 
@@ -44,6 +44,10 @@ describe('Utils', () => {
       const normalized = normalizeSessionId('  abc-123  ');
       expect(normalized).to.equal('abc-123');
     });
+
+    it('should return already-normalized IDs unchanged', () => {
+      expect(normalizeSessionId('abc-123-def')).to.equal('abc-123-def');
+    });
   });
 
   describe('createErrorResponse', () => {